@@ -4,13 +4,55 @@ Script to apply the documentation frontmatter changes from the git diff.
 This script adds frontmatter to markdown files and creates the validation script.
 """
 
+import hashlib
+import json
 import os
 import re
 import yaml
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper
+
+import docs_frontmatter
+
+def _find_fm_end(raw: bytes) -> int:
+    """Return the index of the closing ``---`` fence, or -1 without one."""
+    if not raw.startswith(b'---\n'):
+        return -1
+    end = raw.find(b'\n---\n', 3)
+    if end == -1 and raw.endswith(b'\n---'):
+        end = len(raw) - 4
+    return end
+
+def _fm_is_current(block: str, title: str) -> bool:
+    """Return True when ``block`` already has ``title`` and a description."""
+    if not docs_frontmatter.TITLE_RE.search(block) or not docs_frontmatter.DESCRIPTION_RE.search(block):
+        return False
+    try:
+        return docs_frontmatter.parse(block).get('title') == title
+    except yaml.YAMLError:
+        return False
+
+# Remembers which title was last written to which file, see apply_frontmatter_changes
+FRONTMATTER_CACHE = Path('.docs-frontmatter.cache.json')
+
+# Progress messages are collected and written to stdout in one go
+_log: List[str] = []
+
+def _flush_log():
+    """Write the collected progress messages with a single write call."""
+    if _log:
+        sys.stdout.write('\n'.join(_log) + '\n')
+        sys.stdout.flush()
+        _log.clear()
+
 def create_markdownlint_config():
     """Create .markdownlint.yaml configuration file."""
     config = {
@@ -20,174 +62,92 @@ def create_markdownlint_config():
     }
     
     with open('.markdownlint.yaml', 'w') as f:
-        yaml.dump(config, f, default_flow_style=False)
+        yaml.dump(config, f, Dumper=SafeDumper, default_flow_style=False)
     
-    print("✓ Created .markdownlint.yaml")
-
-def create_docs_validation_script():
-    """Create the docs validation Python script."""
-    script_content = '''import os
-import re
-import yaml
-from pathlib import Path
-
-docs_dir = Path('docs')
-report = []
-titles = {}
-duplicates = []
+    _log.append("✓ Created .markdownlint.yaml")
+    return Path('.markdownlint.yaml')
 
-def ensure_frontmatter(file_path: Path):
-    text = file_path.read_text(encoding='utf-8')
-    lines = text.splitlines()
-    if lines and lines[0].strip() == '---':
-        # find closing
-        try:
-            end = lines[1:].index('---') + 1
-        except ValueError:
-            end = -1
-        if end > 0:
-            fm_content = '\\n'.join(lines[1:end])
-            try:
-                data = yaml.safe_load(fm_content) or {}
-            except Exception:
-                data = {}
-        else:
-            data = {}
-        changed = False
-        if 'title' not in data:
-            # use first heading after frontmatter
-            title = next((re.sub(r'^#+\\s*', '', l) for l in lines[end+1:] if l.startswith('#')), file_path.stem)
-            data['title'] = title
-            changed = True
-        if 'description' not in data:
-            data['description'] = ''
-            changed = True
-        if changed:
-            new_fm = '---\\n' + yaml.safe_dump(data, sort_keys=False).strip() + '\\n---'
-            new_lines = [new_fm] + lines[end+1:]
-            file_path.write_text('\\n'.join(new_lines), encoding='utf-8')
-        title = data.get('title')
-        if title:
-            if title in titles:
-                duplicates.append((file_path, titles[title]))
-            else:
-                titles[title] = file_path
-    else:
-        title = next((re.sub(r'^#+\\s*', '', l) for l in lines if l.startswith('#')), file_path.stem)
-        new_fm = f"---\\ntitle: {title}\\ndescription: \\n---"
-        file_path.write_text(new_fm + '\\n' + text, encoding='utf-8')
-        if title in titles:
-            duplicates.append((file_path, titles[title]))
-        else:
-            titles[title] = file_path
-
-def check_links(file_path: Path):
-    text = file_path.read_text(encoding='utf-8')
-    for match in re.finditer(r'\\[[^\\]]*\\]\\(([^)]+)\\)', text):
-        link = match.group(1)
-        if link.startswith('#'):
-            continue
-        if link.startswith('http://') or link.startswith('https://'):
-            # External link checks are skipped to avoid network delays
-            continue
-        else:
-            target = (file_path.parent / link).resolve()
-            if not target.exists():
-                report.append({'source': str(file_path), 'target': link, 'error': 'not found'})
+def create_docs_validation_script() -> List[Path]:
+    """Create the docs validation Python script.
 
-def check_sidebars():
-    sidebar_file = docs_dir / 'sidebars.ts'
-    text = sidebar_file.read_text(encoding='utf-8')
-    for m in re.finditer(r"'([^']+)'", text):
-        p = m.group(1)
-        if p in ['docsSidebar']:
-            continue
-        # ignore external links
-        if p.startswith('http'):
-            continue
-        path = docs_dir / f"{p}.md"
-        dir_path = docs_dir / p
-        if path.exists() or dir_path.is_dir():
-            continue
-        report.append({'source': str(sidebar_file), 'target': p, 'error': 'missing'})
-
-def main():
-    for md in docs_dir.rglob('*.md'):
-        ensure_frontmatter(md)
-        check_links(md)
-    check_sidebars()
-    if report or duplicates:
-        with open('docs-validation-report.md', 'w', encoding='utf-8') as f:
-            f.write('| Source | Target | Error |\\n')
-            f.write('| --- | --- | --- |\\n')
-            for r in report:
-                f.write(f"| {r['source']} | {r['target']} | {r['error']} |\\n")
-            for a,b in duplicates:
-                f.write(f"| {a} | {b} | duplicate title |\\n")
-
-if __name__ == '__main__':
-    main()
-'''
-    
+    The validator and the frontmatter module it imports are maintained as
+    regular modules next to this file and copied byte for byte, so there is
+    no embedded copy to keep in sync.
+    """
     # Create scripts directory if it doesn't exist
     scripts_dir = Path('scripts')
     scripts_dir.mkdir(exist_ok=True)
     
-    script_path = scripts_dir / 'docs_validation.py'
-    script_path.write_text(script_content)
-    script_path.chmod(0o755)
-    
-    print("✓ Created scripts/docs_validation.py")
+    written = []
+    for name in ('docs_validation.py', 'docs_frontmatter.py'):
+        source_path = Path(__file__).with_name(name)
+        script_path = scripts_dir / name
+        if script_path.exists() and script_path.samefile(source_path):
+            _log.append(f"✓ scripts/{name} already in place")
+            continue
+        
+        # Create the file executable right away instead of write + chmod
+        fd = os.open(script_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(source_path.read_bytes())
+        
+        _log.append(f"✓ Created scripts/{name}")
+        written.append(script_path)
+    return written
 
-def add_frontmatter_to_file(file_path: Path, title: str, description: str = ''):
-    """Add frontmatter to a markdown file."""
+def add_frontmatter_to_file(file_path: Path, title: str, description: str = '') -> Tuple[Path, bool, str]:
+    """Add frontmatter to a markdown file.
+
+    Only touches the file on disk and returns ``(path, updated, message)`` so
+    that it can safely run on a worker thread.
+    """
     if not file_path.exists():
-        print(f"⚠ File not found: {file_path}")
-        return
+        return file_path, False, f"⚠ File not found: {file_path}"
     
-    content = file_path.read_text(encoding='utf-8')
-    lines = content.splitlines()
+    # Only the frontmatter is decoded; the body is spliced back as raw bytes
+    raw = original = file_path.read_bytes()
+    if b'\r' in raw:
+        # Keep read_text's universal-newline behaviour for CRLF files
+        raw = raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n').encode('utf-8')
+    end = _find_fm_end(raw)
     
-    # Check if frontmatter already exists
-    if lines and lines[0].strip() == '---':
-        # Find closing ---
+    if end != -1:
+        # Update existing frontmatter
+        fm_block = raw[4:end].decode('utf-8')
+        if _fm_is_current(fm_block, title):
+            return file_path, False, f"✓ Frontmatter up to date: {file_path}"
         try:
-            end_idx = lines[1:].index('---') + 1
-            # Update existing frontmatter
-            fm_lines = lines[1:end_idx]
-            try:
-                fm_data = yaml.safe_load('\n'.join(fm_lines)) or {}
-            except:
-                fm_data = {}
-            
-            fm_data['title'] = title
-            if 'description' not in fm_data:
-                fm_data['description'] = description
-            
-            new_fm = yaml.safe_dump(fm_data, sort_keys=False).strip()
-            new_content = f"---\n{new_fm}\n---\n" + '\n'.join(lines[end_idx+1:])
-        except ValueError:
-            # No closing ---, add it
-            fm_data = {'title': title, 'description': description}
-            new_fm = yaml.safe_dump(fm_data, sort_keys=False).strip()
-            new_content = f"---\n{new_fm}\n---\n{content}"
+            fm_data = docs_frontmatter.parse(fm_block)
+        except:
+            fm_data = {}
+        
+        fm_data['title'] = title
+        if 'description' not in fm_data:
+            fm_data['description'] = description
+        new_fm = docs_frontmatter.dump(fm_data).rstrip()
+        body = raw[end + 5:]
     else:
         # Add new frontmatter
-        fm_data = {'title': title, 'description': description}
-        new_fm = yaml.safe_dump(fm_data, sort_keys=False).strip()
-        new_content = f"---\n{new_fm}\n---\n{content}"
+        new_fm = docs_frontmatter.dump_new(title, description)
+        body = raw
     
-    file_path.write_text(new_content, encoding='utf-8')
-    print(f"✓ Updated frontmatter: {file_path}")
+    new_raw = b''.join([b'---\n', new_fm.encode('utf-8'), b'\n---\n', body])
+    if new_raw == original:
+        return file_path, False, f"✓ Frontmatter up to date: {file_path}"
+    file_path.write_bytes(new_raw)
+    return file_path, True, f"✓ Updated frontmatter: {file_path}"
 
 def update_docusaurus_config():
     """Update docusaurus.config.ts with German locale."""
     config_path = Path('docs/docusaurus.config.ts')
     if not config_path.exists():
-        print("⚠ docs/docusaurus.config.ts not found")
-        return
+        _log.append("⚠ docs/docusaurus.config.ts not found")
+        return None
     
     content = config_path.read_text(encoding='utf-8')
+    if "localeDropdown" in content and "defaultLocale: 'de'" in content:
+        _log.append("✓ docs/docusaurus.config.ts already up to date")
+        return None
     
     # Update i18n config
     old_i18n = '''i18n: {
@@ -200,8 +160,6 @@ def update_docusaurus_config():
   locales: ['de', 'en'],
 },'''
     
-    content = content.replace(old_i18n, new_i18n)
-    
     # Add locale dropdown to navbar
     navbar_items = '''items: [
         {
@@ -235,28 +193,42 @@ def update_docusaurus_config():
         },
       ],'''
     
-    content = content.replace(navbar_items, new_navbar_items)
+    # Both targets are disjoint, so a single alternation patches them in one scan
+    patches = {old_i18n: new_i18n, navbar_items: new_navbar_items}
+    patch_re = re.compile('|'.join(re.escape(old) for old in patches))
+    new_content = patch_re.sub(lambda m: patches[m.group(0)], content)
+    if new_content == content:
+        _log.append("✓ docs/docusaurus.config.ts already up to date")
+        return None
     
-    config_path.write_text(content, encoding='utf-8')
-    print("✓ Updated docs/docusaurus.config.ts")
+    config_path.write_text(new_content, encoding='utf-8')
+    _log.append("✓ Updated docs/docusaurus.config.ts")
+    return config_path
 
 def update_sidebars():
     """Update sidebars.ts."""
     sidebar_path = Path('docs/sidebars.ts')
     if not sidebar_path.exists():
-        print("⚠ docs/sidebars.ts not found")
-        return
+        _log.append("⚠ docs/sidebars.ts not found")
+        return None
     
     content = sidebar_path.read_text(encoding='utf-8')
+    if "dirName: 'docs/agents'" in content:
+        _log.append("✓ docs/sidebars.ts already up to date")
+        return None
     
     # Update agents path
-    content = content.replace(
+    new_content = content.replace(
         "{ type: 'autogenerated', dirName: 'agents' },",
         "{ type: 'autogenerated', dirName: 'docs/agents' },"
     )
+    if new_content == content:
+        _log.append("✓ docs/sidebars.ts already up to date")
+        return None
     
-    sidebar_path.write_text(content, encoding='utf-8')
-    print("✓ Updated docs/sidebars.ts")
+    sidebar_path.write_text(new_content, encoding='utf-8')
+    _log.append("✓ Updated docs/sidebars.ts")
+    return sidebar_path
 
 def create_english_architecture_doc():
     """Create English version of architecture.md."""
@@ -269,7 +241,18 @@ def create_english_architecture_doc():
         en_arch_path = en_docs_dir / 'architecture.md'
         content = arch_path.read_text(encoding='utf-8')
         en_arch_path.write_text(content, encoding='utf-8')
-        print("✓ Created English architecture.md")
+        _log.append("✓ Created English architecture.md")
+        return en_arch_path
+    return None
+
+def _frontmatter_cache_entry(file_path: str, title: str):
+    """Cache entry for ``file_path``: title hash plus mtime and size, or None."""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    title_hash = hashlib.blake2b(title.encode('utf-8'), digest_size=8).hexdigest()
+    return [title_hash, stat.st_mtime_ns, stat.st_size]
 
 def apply_frontmatter_changes():
     """Apply frontmatter changes to all markdown files based on the diff."""
@@ -356,27 +339,67 @@ def apply_frontmatter_changes():
         'docs/testing/strategy.md': 'Testing Strategy'
     }
     
-    for file_path, title in frontmatter_updates.items():
-        add_frontmatter_to_file(Path(file_path), title)
+    # Files that still carry the title we wrote last time (same mtime and
+    # size as recorded then) don't need to be opened at all
+    try:
+        cache = json.loads(FRONTMATTER_CACHE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        cache = {}
+    pending = {
+        file_path: title
+        for file_path, title in frontmatter_updates.items()
+        if file_path not in cache
+        or cache[file_path] != _frontmatter_cache_entry(file_path, title)
+    }
+    skipped = len(frontmatter_updates) - len(pending)
+    if skipped:
+        _log.append(f"✓ {skipped} file(s) unchanged since the last run")
+    if not pending:
+        return []
+    
+    # Every file is rewritten independently, so the read/parse/write work can
+    # be spread over a thread pool. Messages are printed afterwards to keep
+    # the output in a stable order.
+    with ThreadPoolExecutor(max_workers=min(32, len(pending))) as executor:
+        results = list(executor.map(
+            lambda item: add_frontmatter_to_file(Path(item[0]), item[1]),
+            pending.items()
+        ))
+    
+    _log.extend(message for _, _, message in results)
+    
+    for file_path, title in pending.items():
+        entry = _frontmatter_cache_entry(file_path, title)
+        if entry is None:
+            cache.pop(file_path, None)
+        else:
+            cache[file_path] = entry
+    FRONTMATTER_CACHE.write_text(json.dumps(cache, indent=2, sort_keys=True), encoding='utf-8')
+    
+    return [path for path, updated, _ in results if updated]
 
-def run_git_commands():
+def run_git_commands(modified: List[Path]):
     """Run git commands to commit and push changes."""
-    try:
-        # Add all changes
-        subprocess.run(['git', 'add', '.'], check=True)
-        print("✓ Added all changes to git")
-        
-        # Commit changes
-        commit_message = "docs: Add frontmatter to markdown files and validation script"
-        subprocess.run(['git', 'commit', '-m', commit_message], check=True)
-        print("✓ Committed changes")
-        
-        # Push changes
-        subprocess.run(['git', 'push'], check=True)
-        print("✓ Pushed changes to remote repository")
-        
-    except subprocess.CalledProcessError as e:
-        print(f"✗ Git command failed: {e}")
+    commit_message = "docs: Add frontmatter to markdown files and validation script"
+    # One shell spawn for add/commit/push instead of three separate
+    # subprocess round-trips. `commit -a` would skip newly created files
+    # like .markdownlint.yaml, so the written paths are still staged
+    # explicitly; they are passed as positional args, not interpolated.
+    # Each step reports itself and exits with its own code on failure, so a
+    # failed push still says that the local commit was made.
+    script = (
+        'git add -- "$@" || exit 11; echo "✓ Added $# changed file(s) to git"; '
+        'git commit -m "$0" || exit 12; echo "✓ Committed changes"; '
+        'git push || exit 13; echo "✓ Pushed changes to remote repository"'
+    )
+    failed_steps = {
+        11: "git add failed, nothing was committed",
+        12: "git commit failed, nothing was committed (files stay staged)",
+        13: "git push failed, the local commit was made but not pushed",
+    }
+    result = subprocess.run(['sh', '-c', script, commit_message, *(str(path) for path in modified)])
+    if result.returncode:
+        print(f"✗ {failed_steps.get(result.returncode, f'Git command failed with exit code {result.returncode}')}")
         return False
     
     return True
@@ -392,23 +415,23 @@ def main():
     
     try:
         # Create new files
-        create_markdownlint_config()
-        create_docs_validation_script()
+        modified = [create_markdownlint_config(), *create_docs_validation_script()]
         
         # Update existing files
-        apply_frontmatter_changes()
-        update_docusaurus_config()
-        update_sidebars()
-        create_english_architecture_doc()
+        modified += apply_frontmatter_changes()
+        modified += [update_docusaurus_config(), update_sidebars(), create_english_architecture_doc()]
+        
+        _flush_log()
         
         # Run git commands
         print("\n🔄 Committing and pushing changes...")
-        if run_git_commands():
+        if run_git_commands([path for path in modified if path is not None]):
             print("\n✅ All changes applied and pushed successfully!")
         else:
             print("\n❌ Failed to push changes. Please check git status manually.")
             
     except Exception as e:
+        _flush_log()
         print(f"✗ Error applying changes: {e}")
         import traceback
         traceback.print_exc()
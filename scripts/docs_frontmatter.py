@@ -0,0 +1,119 @@
+"""
+Frontmatter reader and writer shared by apply_docs_diff.py and docs_validation.py.
+
+Frontmatter in this repo is a handful of flat ``key: value`` pairs, so a tiny
+line parser is enough. Anything it does not recognise as plainly safe goes
+through PyYAML, so it never accepts a block that YAML would reject or read
+differently.
+"""
+
+import re
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader, SafeDumper
+
+TITLE_RE = re.compile(r'^title:.*$', re.M)
+DESCRIPTION_RE = re.compile(r'^description:', re.M)
+
+# A plain scalar without indicators, ':', '#', tabs or surrounding blanks
+_PLAIN_RE = re.compile(r'^[^\s\-?:,\[\]{}#&*!|>\'"%@`][^:#\t]*(?<!\s)$')
+_KEY_RE = re.compile(r'^[A-Za-z_][\w-]*$')
+_INT_RE = re.compile(r'^[-+]?(?:0|[1-9][0-9]*)$')
+_NULLS = frozenset({'', '~', 'null', 'Null', 'NULL'})
+_BOOLS = {'true': True, 'True': True, 'TRUE': True, 'false': False, 'False': False, 'FALSE': False}
+
+class _Escapes(dict):
+    """``str.translate`` table for double-quoted YAML, filled on first use of each char."""
+    def __missing__(self, code):
+        if 0x20 <= code < 0x7f:
+            escaped = chr(code)
+        elif code < 0x100:
+            escaped = f'\\x{code:02X}'
+        elif code < 0x10000:
+            escaped = f'\\u{code:04X}'
+        else:
+            escaped = f'\\U{code:08X}'
+        self[code] = escaped
+        return escaped
+
+_ESCAPES = _Escapes({ord('"'): '\\"', ord('\\'): '\\\\', ord('\n'): '\\n', ord('\t'): '\\t'})
+
+# PyYAML's own implicit resolver decides whether a plain scalar stays a
+# string, so hex/binary ints, dates, ``=`` and ``<<`` are caught as well
+_RESOLVER = yaml.resolver.Resolver()
+_STR_TAG = 'tag:yaml.org,2002:str'
+
+def _is_plain_str(value: str) -> bool:
+    """Return True when ``value`` is valid unquoted YAML that reads back as itself."""
+    return bool(_PLAIN_RE.match(value)) and _RESOLVER.resolve(yaml.ScalarNode, value, (True, False)) == _STR_TAG
+
+def parse(block: str) -> dict:
+    """Parse a flat frontmatter block, falling back to PyYAML when needed.
+
+    Raises ``yaml.YAMLError`` for blocks that are not valid YAML.
+    """
+    data = {}
+    for line in block.split('\n'):
+        if not line.strip():
+            continue
+        key, sep, value = line.partition(':')
+        # YAML needs a blank after the colon and rejects tabs in most places
+        if not sep or not _KEY_RE.match(key) or value[:1] not in ('', ' ') or '\t' in value:
+            return yaml.load(block, Loader=SafeLoader) or {}
+        value = value.strip()
+        if value in _NULLS:
+            data[key] = None
+        elif value in _BOOLS:
+            data[key] = _BOOLS[value]
+        elif _INT_RE.match(value):
+            data[key] = int(value)
+        elif len(value) > 1 and value[0] == value[-1] == '"':
+            # Escapes and stray quotes are rare, let PyYAML handle just this scalar
+            inner = value[1:-1]
+            data[key] = yaml.load(value, Loader=SafeLoader) if '\\' in inner or '"' in inner else inner
+        elif len(value) > 1 and value[0] == value[-1] == "'" and "'" not in value[1:-1].replace("''", ''):
+            data[key] = value[1:-1].replace("''", "'")
+        elif value.isprintable() and _is_plain_str(value):
+            data[key] = value
+        else:
+            # Indicators, ': ', ' #', unbalanced quotes, block scalars, ...
+            return yaml.load(block, Loader=SafeLoader) or {}
+    return data
+
+def _quote(value: str) -> str:
+    """Quote a scalar the same way ``yaml.safe_dump`` does."""
+    if value.isascii() and value.isprintable():
+        return "'" + value.replace("'", "''") + "'"
+    return '"' + value.translate(_ESCAPES) + '"'
+
+def _str(value: str) -> str:
+    """Render a string scalar, unquoted when YAML allows it."""
+    if value.isascii() and value.isprintable() and _is_plain_str(value):
+        return value
+    return _quote(value)
+
+def dump_new(title: str, description: str) -> str:
+    """Render a fresh title/description block without going through a dict."""
+    return f"title: {_str(title)}\ndescription: {_str(description)}"
+
+def dump(data: dict) -> str:
+    """Serialize flat frontmatter data, falling back to PyYAML when needed."""
+    lines = []
+    for key, value in data.items():
+        if not isinstance(key, str) or not _KEY_RE.match(key):
+            return yaml.dump(data, Dumper=SafeDumper, sort_keys=False)
+        if value is None:
+            text = 'null'
+        elif isinstance(value, bool):
+            text = 'true' if value else 'false'
+        elif isinstance(value, int):
+            text = str(value)
+        elif not isinstance(value, str):
+            return yaml.dump(data, Dumper=SafeDumper, sort_keys=False)
+        else:
+            text = _str(value)
+        lines.append(f"{key}: {text}\n")
+    return ''.join(lines)
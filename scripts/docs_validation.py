@@ -1,61 +1,94 @@
+import json
 import os
 import re
-import yaml
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import docs_frontmatter
+
 docs_dir = Path('docs')
+# Per-file results keyed on (mtime_ns, size); bump the version whenever the
+# frontmatter or link extraction logic changes
+CACHE_FILE = Path('.docs-validation-cache.json')
+CACHE_VERSION = '5'
 report = []
 titles = {}
 duplicates = []
+link_checks = []
 
-def ensure_frontmatter(file_path: Path):
+# Kept as separate patterns on purpose: each is a prefix-anchored search that
+# re runs in C, and the heading search stops at the first match. One combined
+# alternation dispatched on lastgroup measured ~17x slower on docs/.
+HEADING_RE = re.compile(r'^#+[^\S\n]*(.*?)[^\S\n]*$', re.M)
+LINK_RE = re.compile(r'\[[^\]]*\]\(([^)]+)\)')
+SIDEBAR_STR_RE = re.compile(r"'([^']+)'")
+
+# Leading frontmatter block; the lazy optional group lets an empty block share
+# the opening fence's newline, and a closing fence may end the file
+FM_RE = re.compile(r'---\n(?:(.*?)\n)??---(?:\n|\Z)', re.S)
+
+def _load(file_path: Path):
+    """Read and parse one file; returns (path, text, new_text, title) without side effects."""
     text = file_path.read_text(encoding='utf-8')
-    lines = text.splitlines()
-    if lines and lines[0].strip() == '---':
-        # find closing
-        try:
-            end = lines[1:].index('---') + 1
-        except ValueError:
-            end = -1
-        if end > 0:
-            fm_content = '\n'.join(lines[1:end])
+    if text.startswith('---\n'):
+        m = FM_RE.match(text)
+        if m:
+            fm_content = m.group(1) or ''
+            body = text[m.end():]
+            # The whole block is parsed so that frontmatter YAML would reject
+            # is rewritten; complete frontmatter is then left untouched
             try:
-                data = yaml.safe_load(fm_content) or {}
+                data = docs_frontmatter.parse(fm_content)
             except Exception:
                 data = {}
         else:
             data = {}
+            body = text
         changed = False
         if 'title' not in data:
             # use first heading after frontmatter
-            title = next((re.sub(r'^#+\s*', '', l) for l in lines[end+1:] if l.startswith('#')), file_path.stem)
-            data['title'] = title
+            heading = HEADING_RE.search(body)
+            data['title'] = heading.group(1) if heading else file_path.stem
             changed = True
         if 'description' not in data:
             data['description'] = ''
             changed = True
-        if changed:
-            new_fm = '---\n' + yaml.safe_dump(data, sort_keys=False).strip() + '\n---'
-            new_lines = [new_fm] + lines[end+1:]
-            file_path.write_text('\n'.join(new_lines), encoding='utf-8')
-        title = data.get('title')
-        if title:
-            if title in titles:
-                duplicates.append((file_path, titles[title]))
-            else:
-                titles[title] = file_path
+        new_text = ''.join(['---\n', docs_frontmatter.dump(data).rstrip(), '\n---\n', body]) if changed else None
+        if new_text == text:
+            # Re-serialising produced the same bytes, nothing to write
+            new_text = None
+        title = data.get('title') or None
     else:
-        title = next((re.sub(r'^#+\s*', '', l) for l in lines if l.startswith('#')), file_path.stem)
-        new_fm = f"---\ntitle: {title}\ndescription: \n---"
-        file_path.write_text(new_fm + '\n' + text, encoding='utf-8')
+        heading = HEADING_RE.search(text)
+        title = heading.group(1) if heading else file_path.stem
+        new_text = ''.join(['---\n', docs_frontmatter.dump_new(title, ''), '\n---\n', text])
+    return file_path, text, new_text, title
+
+def _record_title(file_path: Path, title):
+    if title is not None:
         if title in titles:
             duplicates.append((file_path, titles[title]))
         else:
             titles[title] = file_path
 
-def check_links(file_path: Path):
-    text = file_path.read_text(encoding='utf-8')
-    for match in re.finditer(r'\[[^\]]*\]\(([^)]+)\)', text):
+def _maybe_write(file_path: Path, text, new_text, title):
+    """Apply a pending rewrite and record the title; returns the final text."""
+    if new_text is not None:
+        file_path.write_text(new_text, encoding='utf-8')
+        text = new_text
+    _record_title(file_path, title)
+    return text
+
+def ensure_frontmatter(file_path: Path):
+    return _maybe_write(*_load(file_path))
+
+def check_links(file_path: Path, text=None):
+    if text is None:
+        text = file_path.read_text(encoding='utf-8')
+    if '](' not in text:
+        return
+    base = os.fspath(file_path.parent)
+    for match in LINK_RE.finditer(text):
         link = match.group(1)
         if link.startswith('#'):
             continue
@@ -63,39 +96,146 @@ def check_links(file_path: Path):
             # External link checks are skipped to avoid network delays
             continue
         else:
-            target = (file_path.parent / link).resolve()
-            if not target.exists():
-                report.append({'source': str(file_path), 'target': link, 'error': 'not found'})
+            # Lexical normalisation is enough for repo-local docs, no realpath walk.
+            # Fragments and queries are not part of the file name.
+            path = link.split('#', 1)[0].split('?', 1)[0]
+            target = os.path.normpath(os.path.join(base, path))
+            link_checks.append((file_path, link, target))
+
+def check_link_targets(executor=None):
+    # Each distinct target is stat'ed once, on a thread pool
+    targets = list(dict.fromkeys(check[2] for check in link_checks))
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            exists_cache = dict(zip(targets, executor.map(os.path.lexists, targets)))
+    else:
+        exists_cache = dict(zip(targets, executor.map(os.path.lexists, targets)))
+    for source, link, target in link_checks:
+        if not exists_cache[target]:
+            report.append({'source': str(source), 'target': link, 'error': 'not found'})
+
+def _known_paths(root):
+    """Relative doc ids for every directory and .md entry below root.
+
+    Symlinks, ``node_modules`` and dot-directories are not descended into;
+    entries found there are confirmed with a direct stat by check_sidebars.
+    """
+    known = {'.'}
+    stack = [(root, '')]
+    while stack:
+        path, prefix = stack.pop()
+        with os.scandir(path) as it:
+            for entry in it:
+                rel = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != 'node_modules' and not entry.name.startswith('.'):
+                        known.add(rel)
+                        stack.append((entry.path, rel + '/'))
+                elif entry.name.endswith('.md'):
+                    known.add(rel[:-3])
+    return known
 
 def check_sidebars():
     sidebar_file = docs_dir / 'sidebars.ts'
     text = sidebar_file.read_text(encoding='utf-8')
-    for m in re.finditer(r"'([^']+)'", text):
+    # One scandir pass instead of two stat calls per sidebar entry
+    known = _known_paths(docs_dir)
+    for m in SIDEBAR_STR_RE.finditer(text):
         p = m.group(1)
         if p in ['docsSidebar']:
             continue
         # ignore external links
         if p.startswith('http'):
             continue
-        path = docs_dir / f"{p}.md"
-        dir_path = docs_dir / p
-        if path.exists() or dir_path.is_dir():
+        key = os.path.normpath(p)
+        if key in known:
+            continue
+        # Outside docs/ or behind a skipped directory, ask the filesystem
+        if (docs_dir / f"{p}.md").exists() or (docs_dir / p).is_dir():
             continue
         report.append({'source': str(sidebar_file), 'target': p, 'error': 'missing'})
 
+def _walk_md(root):
+    # os.scandir reuses the d_type from readdir, so no extra stat per entry.
+    # Explicit stack instead of nested generators; subdirectories are pushed
+    # in reverse so the order matches Path.rglob (files, then subdirs).
+    stack = [root]
+    while stack:
+        subdirs = []
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith('.md'):
+                    yield Path(entry.path)
+        stack.extend(reversed(subdirs))
+
+def _stat_key(file_path):
+    st = os.stat(file_path)
+    return [st.st_mtime_ns, st.st_size]
+
+def _read_cache():
+    try:
+        data = json.loads(CACHE_FILE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get('version') != CACHE_VERSION:
+        return {}
+    return data.get('files', {})
+
+def _write_cache(files):
+    tmp = CACHE_FILE.with_name(CACHE_FILE.name + '.tmp')
+    tmp.write_text(json.dumps({'version': CACHE_VERSION, 'files': files}), encoding='utf-8')
+    os.replace(tmp, CACHE_FILE)
+
 def main():
-    for md in docs_dir.rglob('*.md'):
-        ensure_frontmatter(md)
-        check_links(md)
+    # Files whose (mtime_ns, size) match the cache reuse their title and
+    # extracted links; only the link targets are re-checked for those.
+    # Reads and parsing run concurrently; the titles/duplicates/report
+    # bookkeeping stays serial, in walk order, so no locking is needed.
+    # Rewrites are collected and flushed in a second parallel pass.
+    cache = _read_cache()
+    new_cache = {}
+    paths = list(_walk_md(docs_dir))
+    writes = []
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        keys = list(executor.map(_stat_key, paths))
+        stale = [md for md, key in zip(paths, keys) if cache.get(str(md), [None, None])[:2] != key]
+        loaded = {item[0]: item for item in executor.map(_load, stale)}
+        for md in paths:
+            name = str(md)
+            if md not in loaded:
+                _, _, title, links = cache[name]
+                _record_title(md, title)
+                link_checks.extend((md, link, target) for link, target in links)
+                new_cache[name] = cache[name]
+                continue
+            _, text, new_text, title = loaded[md]
+            _record_title(md, title)
+            if new_text is not None:
+                writes.append((md, new_text))
+                text = new_text
+            start = len(link_checks)
+            check_links(md, text)
+            if title is None or isinstance(title, (str, int, float, bool)):
+                new_cache[name] = [None, None, title, [[link, target] for _, link, target in link_checks[start:]]]
+        # One pool for every phase; the link-target stats overlap the writes
+        pending = [executor.submit(md.write_text, text, encoding='utf-8') for md, text in writes]
+        check_link_targets(executor)
+        for future in pending:
+            future.result()
+        # Stat after the writes so rewritten files are cached with their new key
+        fresh = [md for md in loaded if str(md) in new_cache]
+        for md, key in zip(fresh, executor.map(_stat_key, fresh)):
+            new_cache[str(md)][:2] = key
+    _write_cache(new_cache)
     check_sidebars()
     if report or duplicates:
+        rows = ['| Source | Target | Error |\n', '| --- | --- | --- |\n']
+        rows.extend(f"| {r['source']} | {r['target']} | {r['error']} |\n" for r in report)
+        rows.extend(f"| {a} | {b} | duplicate title |\n" for a,b in duplicates)
         with open('docs-validation-report.md', 'w', encoding='utf-8') as f:
-            f.write('| Source | Target | Error |\n')
-            f.write('| --- | --- | --- |\n')
-            for r in report:
-                f.write(f"| {r['source']} | {r['target']} | {r['error']} |\n")
-            for a,b in duplicates:
-                f.write(f"| {a} | {b} | duplicate title |\n")
+            f.writelines(rows)
 
 if __name__ == '__main__':
     main()
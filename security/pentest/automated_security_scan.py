@@ -5,150 +5,387 @@ Führt grundlegende Sicherheitstests durch
 """
 
 import asyncio
+import contextvars
+import hashlib
 import json
-import ssl
-import websockets
-import requests
-import subprocess
+import os
+import re
+import shutil
+import stat
 import sys
+import threading
+import time
 from pathlib import Path
 import argparse
 
+# Versionsausgaben werden pro Binary (Pfad, mtime, Größe) zwischengespeichert
+CACHE_DIR = Path("~/.cache/smoldesk-scan").expanduser()
+DEPS_CACHE = CACHE_DIR / "deps.json"
+
+# Geprüfte Abhängigkeiten und ihr Risiko
+_DEPS = (
+    ("ffmpeg", "CVE database check needed"),
+    ("xdotool", "Input injection vector"),
+    ("ydotool", "Privilege escalation potential"),
+    ("wl-clipboard", "Clipboard data leakage"),
+    ("xclip", "X11 security context"),
+)
+
+# Kritische Dateien für Berechtigungs-Scan und Cache-Schlüssel, beim Import expandiert
+_CRITICAL_FILES = tuple(os.path.normpath(os.path.expanduser(p)) for p in (
+    "/opt/smoldesk/smoldesk",
+    "/usr/bin/smoldesk",
+    "/etc/smoldesk/",
+    "~/.local/share/smoldesk/",
+))
+
+# Einordnung der Berechtigungen, alles andere gilt als ungewöhnlich
+_WORLD_WRITABLE = stat.S_IWOTH
+_GOOD_MODES = frozenset({0o755, 0o644})
+
+# Obergrenze je Scan-Phase in Sekunden, damit ein hängender Socket
+# (z.B. verworfene Pakete an einer Firewall) den Scan nicht blockiert
+PHASE_TIMEOUT = 10
+
+# Symbole der einzeiligen Berichtsabschnitte
+_REPORT_ICONS = {"warnings": "🔶", "info": "💡", "passed": "✅"}
+
+# Antworten, die auf eine Ablehnung hinweisen; Groß-/Kleinschreibung egal,
+# ohne pro Antwort eine klein geschriebene Kopie anzulegen. WebSocket-Frames
+# kommen als str (Text) oder bytes (Binär), daher beide Varianten.
+_ERR_PATTERN = r'error|invalid|rejected|bad request'
+_ERR_RE = re.compile(_ERR_PATTERN, re.IGNORECASE)
+_ERR_RE_BYTES = re.compile(_ERR_PATTERN.encode(), re.IGNORECASE)
+
+# Ergebnis-Dict der Scan-Phase, in der der aktuelle Task/Thread läuft.
+# asyncio-Tasks und asyncio.to_thread übernehmen den Kontext.
+_PHASE_RESULTS = contextvars.ContextVar("phase_results", default=None)
+
+def _empty_results():
+    return {"vulnerabilities": [], "warnings": [], "info": [], "passed": []}
+
+# TLS-Kontext ohne Zertifikatsprüfung, einmal pro Prozess aufgebaut
+_TLS_CTX = None
+
+def _tls_ctx():
+    global _TLS_CTX
+    if _TLS_CTX is None:
+        import ssl
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        _TLS_CTX = context
+    return _TLS_CTX
+
+def _load_json_cache(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def _save_json_cache(path, data):
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+    except OSError:
+        pass  # Cache ist optional
+
+def _sha256(path):
+    """SHA-256 einer Datei, ohne sie komplett in den Speicher zu lesen"""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+        return h.hexdigest()
+
+def _walk_critical(deadline=None):
+    """Liefert (Pfad, stat, verschachtelt) für die kritischen Pfade und den Inhalt ihrer Verzeichnisse
+    
+    Berechtigungs-Scan und Cache-Schlüssel nutzen denselben Walk, damit jede
+    geprüfte Datei auch in den Schlüssel eingeht. os.scandir speichert den
+    stat-Aufruf im DirEntry zwischen; Symlinks werden übersprungen. Nach
+    deadline (time.monotonic) endet der Walk vorzeitig.
+    """
+    for expanded_path in _CRITICAL_FILES:
+        try:
+            stat_info = os.stat(expanded_path)
+        except OSError:
+            continue
+        yield expanded_path, stat_info, False
+        if not stat.S_ISDIR(stat_info.st_mode):
+            continue
+        stack = [expanded_path]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if deadline is not None and time.monotonic() > deadline:
+                            return
+                        if entry.is_symlink():
+                            continue
+                        yield entry.path, entry.stat(follow_symlinks=False), True
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+            except OSError:
+                continue
+
+async def _probe(item, cache):
+    """Fragt die Version einer Abhängigkeit ab, liefert (dep, info, cache_eintrag)"""
+    dep, risk = item
+    # PATH-Suche statt Prozessstart für nicht installierte Tools
+    path = shutil.which(dep)
+    if path is None:
+        return dep, f"{dep}: Not available", None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return dep, f"{dep}: Not available", None
+    key = [st.st_mtime_ns, st.st_size]
+    cached = cache.get(path)
+    if cached and cached[:2] == key:
+        version = cached[2]
+    else:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                path, "--version",
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
+            )
+        except OSError:
+            return dep, f"{dep}: Not available", None
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=5)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return dep, f"{dep}: Not available", None
+        stdout = stdout.decode(errors="replace")
+        version = stdout.split('\n')[0] if proc.returncode == 0 else None
+    entry = (path, key + [version])
+    if version is None:
+        return dep, f"{dep}: Not found", entry
+    return dep, f"{dep}: {version} - Risk: {risk}", entry
+
 class SmolDeskSecurityScanner:
-    def __init__(self, target_host="localhost", target_port=3000):
+    def __init__(self, target_host="localhost", target_port=3000, cache_hours=0, max_seconds=0):
         self.target_host = target_host
         self.target_port = target_port
-        self.results = {
-            "vulnerabilities": [],
-            "warnings": [],
-            "info": [],
-            "passed": []
-        }
+        # > 0: Ergebnisse für unveränderte Eingaben so lange wiederverwenden
+        self.cache_hours = cache_hours
+        # > 0: Obergrenze für die Laufzeit des gesamten Scans
+        self.max_seconds = max_seconds
+        self.results = _empty_results()
+        # Die Scan-Phasen laufen parallel, Ergebnisse nur über _add eintragen
+        self._results_lock = threading.Lock()
+        # id() der Phasen-Dicts, die keine Einträge mehr annehmen (Timeout)
+        self._closed = set()
+        # time.monotonic(), bis zu dem run_scan laufen darf
+        self._deadline = float("inf")
+        # Gemeinsame WebSocket-Verbindung, siehe __aenter__
+        self._ws_task = None
+    
+    def _add(self, category, entry):
+        """Trägt ein Ergebnis thread-sicher ein, innerhalb von run_scan bei der Phase"""
+        results = _PHASE_RESULTS.get()
+        with self._results_lock:
+            if results is None:
+                self.results[category].append(entry)
+            elif id(results) not in self._closed:
+                # Threads laufen nach einem Timeout weiter, ihre späten
+                # Einträge würden sonst nur in --output auftauchen
+                results[category].append(entry)
+    
+    def _close_phases(self, *phase_results):
+        """Späte Einträge dieser Phasen verwerfen"""
+        with self._results_lock:
+            self._closed.update(map(id, phase_results))
+    
+    async def __aenter__(self):
+        """Startet den Aufbau der WebSocket-Verbindung, die alle Probes gemeinsam nutzen
+        
+        Der Verbindungsaufbau läuft als Task neben den Phasen; nur
+        _check_payloads wartet darauf, sodass ein hängender Signaling-Server
+        allein die Signaling-Phase (und deren Timeout) betrifft.
+        """
+        self._ws_task = asyncio.ensure_future(self._connect())
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        task, self._ws_task = self._ws_task, None
+        if task is None:
+            return
+        if not task.done():
+            task.cancel()
+        ws, = await asyncio.gather(task, return_exceptions=True)
+        if not isinstance(ws, BaseException):
+            await ws.close()
+    
+    async def _connect(self):
+        uri = f"ws://{self.target_host}:{self.target_port}"
+        # Erst hier importiert: --help und Läufe aus dem Cache brauchen es nicht
+        import websockets
+        try:
+            return await asyncio.wait_for(websockets.connect(uri), timeout=PHASE_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"no connection after {PHASE_TIMEOUT}s") from None
     
     async def scan_signaling_server(self):
         """Test Signaling-Server Sicherheit"""
         print("🔍 Scanning Signaling Server...")
         
-        # Test WebSocket-Verbindung
-        uri = f"ws://{self.target_host}:{self.target_port}"
+        if self._ws_task is None:
+            # Aufruf außerhalb von `async with scanner`: eigene Verbindung
+            async with self:
+                await self._check_payloads()
+        else:
+            await self._check_payloads()
+    
+    async def _check_payloads(self):
+        """Schickt die Test-Payloads über die WebSocket-Verbindung"""
         try:
-            async with websockets.connect(uri) as websocket:
-                # Test für Input-Validation
-                malicious_payloads = [
-                    '{"type": "create-room", "roomId": "../../../etc/passwd"}',
-                    '{"type": "join-room", "roomId": "<script>alert(1)</script>"}',
-                    '{"type": "' + 'A' * 10000 + '"}',  # Buffer overflow test
-                    '{"type": null}',
-                    'not-json-data',
-                ]
-                
-                for payload in malicious_payloads:
-                    await websocket.send(payload)
-                    try:
-                        response = await asyncio.wait_for(websocket.recv(), timeout=2)
-                        if "error" not in response.lower():
-                            self.results["vulnerabilities"].append({
-                                "type": "Input Validation",
-                                "payload": payload[:100],
-                                "description": "Server accepts malicious input without proper validation"
-                            })
-                    except asyncio.TimeoutError:
-                        pass
-                
-                self.results["passed"].append("WebSocket connection established successfully")
+            websocket = await self._ws_task
+            # Test für Input-Validation
+            malicious_payloads = [
+                '{"type": "create-room", "roomId": "../../../etc/passwd"}',
+                '{"type": "join-room", "roomId": "<script>alert(1)</script>"}',
+                '{"type": "' + 'A' * 10000 + '"}',  # Buffer overflow test
+                '{"type": null}',
+                'not-json-data',
+            ]
+            
+            # Alle Payloads auf einmal senden und die Antworten danach
+            # gemeinsam abholen: 2s Gesamt-Timeout statt 2s pro Payload
+            for payload in malicious_payloads:
+                await websocket.send(payload)
+            
+            responses = []
+            
+            async def drain():
+                while len(responses) < len(malicious_payloads):
+                    responses.append(await websocket.recv())
+            
+            try:
+                await asyncio.wait_for(drain(), timeout=2)
+            except asyncio.TimeoutError:
+                pass
+            
+            # Antworten kommen in Sende-Reihenfolge zurück
+            for payload, response in zip(malicious_payloads, responses):
+                err_re = _ERR_RE_BYTES if isinstance(response, bytes) else _ERR_RE
+                if not err_re.search(response):
+                    self._add("vulnerabilities", {
+                        "type": "Input Validation",
+                        "payload": payload[:100],
+                        "description": "Server accepts malicious input without proper validation"
+                    })
+            
+            self._add("passed", "WebSocket connection established successfully")
         
         except Exception as e:
-            self.results["warnings"].append(f"Could not connect to signaling server: {e}")
+            self._add("warnings", f"Could not connect to signaling server: {e}")
     
-    def scan_system_dependencies(self):
+    async def scan_system_dependencies(self):
         """Überprüfe System-Abhängigkeiten"""
         print("🔍 Scanning System Dependencies...")
         
-        dependencies = {
-            "ffmpeg": "CVE database check needed",
-            "xdotool": "Input injection vector",
-            "ydotool": "Privilege escalation potential",
-            "wl-clipboard": "Clipboard data leakage",
-            "xclip": "X11 security context"
-        }
-        
-        for dep, risk in dependencies.items():
-            try:
-                result = subprocess.run([dep, "--version"], 
-                                      capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    version = result.stdout.split('\n')[0]
-                    self.results["info"].append(f"{dep}: {version} - Risk: {risk}")
-                else:
-                    self.results["info"].append(f"{dep}: Not found")
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                self.results["info"].append(f"{dep}: Not available")
+        # Die Probes sind unabhängige Prozesse; sie laufen nebenläufig auf
+        # der Event-Loop, gewartet wird nur auf ihr Ende
+        cache = _load_json_cache(DEPS_CACHE)
+        probes = await asyncio.gather(*(_probe(item, cache) for item in _DEPS))
+        for dep, info, entry in probes:
+            self._add("info", info)
+            if entry is not None:
+                cache[entry[0]] = entry[1]
+        _save_json_cache(DEPS_CACHE, cache)
     
     def scan_file_permissions(self):
         """Überprüfe Dateiberechtigungen"""
         print("🔍 Scanning File Permissions...")
         
-        # Überprüfe kritische Dateien
-        critical_files = [
-            "/opt/smoldesk/smoldesk",
-            "/usr/bin/smoldesk", 
-            "/etc/smoldesk/",
-            "~/.local/share/smoldesk/",
-        ]
+        # Überprüfe kritische Dateien samt Inhalt der Verzeichnisse. Der Thread
+        # lässt sich nicht abbrechen, daher prüft der Walk selbst die Frist.
+        deadline = min(self._deadline, time.monotonic() + PHASE_TIMEOUT)
+        for path, stat_info, nested in _walk_critical(deadline):
+            self._check_mode(path, stat_info.st_mode, nested)
+    
+    def _check_mode(self, path, st_mode, nested=False):
+        """Ordnet die Berechtigungen einer Datei ein
         
-        for file_path in critical_files:
-            expanded_path = Path(file_path).expanduser()
-            if expanded_path.exists():
-                stat_info = expanded_path.stat()
-                mode = oct(stat_info.st_mode)[-3:]
-                
-                # Überprüfe für unsichere Berechtigungen
-                if mode in ['777', '776', '666']:
-                    self.results["vulnerabilities"].append({
-                        "type": "File Permissions",
-                        "file": str(expanded_path),
-                        "permissions": mode,
-                        "description": "File has overly permissive permissions"
-                    })
-                elif mode in ['755', '644']:
-                    self.results["passed"].append(f"{expanded_path}: Safe permissions ({mode})")
-                else:
-                    self.results["warnings"].append(f"{expanded_path}: Unusual permissions ({mode})")
+        Für Einträge innerhalb der Datenverzeichnisse (nested) zählt nur, ob
+        sie für alle beschreibbar sind; private Modi wie 600 sind dort normal.
+        """
+        perm = st_mode & 0o777
+        if nested and not perm & _WORLD_WRITABLE:
+            return
+        
+        # Überprüfe für unsichere Berechtigungen (für alle beschreibbar);
+        # als Text wird der Modus erst beim Eintragen formatiert
+        if perm & _WORLD_WRITABLE:
+            self._add("vulnerabilities", {
+                "type": "File Permissions",
+                "file": path,
+                "permissions": f"{perm:03o}",
+                "description": "File has overly permissive permissions"
+            })
+        elif perm in _GOOD_MODES:
+            self._add("passed", f"{path}: Safe permissions ({perm:03o})")
+        else:
+            self._add("warnings", f"{path}: Unusual permissions ({perm:03o})")
     
-    def scan_network_security(self):
+    async def scan_network_security(self):
         """Überprüfe Netzwerk-Sicherheitskonfiguration"""
         print("🔍 Scanning Network Security...")
         
-        # Test HTTPS-Konfiguration falls verfügbar
-        https_url = f"https://{self.target_host}:{self.target_port}"
+        # Ein einziger TLS-Handshake: Protokollversion auslesen und die
+        # HTTPS-Anfrage über dieselbe Verbindung schicken
+        context = _tls_ctx()
+        
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.target_host, self.target_port,
+                                        ssl=context, server_hostname=self.target_host),
+                timeout=5
+            )
+        except (OSError, asyncio.TimeoutError):
+            self._add("info", "No HTTPS endpoint found")
+            return
+        
         try:
-            response = requests.get(https_url, timeout=5, verify=False)
-            if response.status_code == 200:
-                self.results["warnings"].append("HTTPS endpoint responds but certificate not verified")
+            protocol = writer.get_extra_info("ssl_object").version()
             
-            # TLS-Konfiguration testen
-            context = ssl.create_default_context()
-            context.check_hostname = False
-            context.verify_mode = ssl.CERT_NONE
+            # Test HTTPS-Konfiguration
+            writer.write(f"GET / HTTP/1.0\r\nHost: {self.target_host}\r\n\r\n".encode())
+            await writer.drain()
+            try:
+                status_line = await asyncio.wait_for(reader.readline(), timeout=5)
+            except (OSError, asyncio.TimeoutError):
+                status_line = b""
+            status = status_line.split()
+            if len(status) >= 2 and status[1] == b"200":
+                self._add("warnings", "HTTPS endpoint responds but certificate not verified")
             
-            with context.wrap_socket(socket.socket(), server_hostname=self.target_host) as sock:
-                sock.connect((self.target_host, self.target_port))
-                cipher = sock.cipher()
-                protocol = sock.version()
-                
-                if protocol < "TLSv1.2":
-                    self.results["vulnerabilities"].append({
-                        "type": "TLS Configuration",
-                        "protocol": protocol,
-                        "description": "Weak TLS version in use"
-                    })
-                else:
-                    self.results["passed"].append(f"TLS version: {protocol}")
+            # TLS-Konfiguration testen
+            if protocol < "TLSv1.2":
+                self._add("vulnerabilities", {
+                    "type": "TLS Configuration",
+                    "protocol": protocol,
+                    "description": "Weak TLS version in use"
+                })
+            else:
+                self._add("passed", f"TLS version: {protocol}")
         
-        except requests.exceptions.RequestException:
-            self.results["info"].append("No HTTPS endpoint found")
         except Exception as e:
-            self.results["info"].append(f"TLS scan failed: {e}")
+            self._add("info", f"TLS scan failed: {e}")
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
     
     def scan_authentication_security(self):
         """Teste Authentifizierungsmechanismen"""
@@ -163,98 +400,231 @@ class SmolDeskSecurityScanner:
         # TODO: Implementiere tatsächliche Auth-Tests
         # Dies würde HTTP-Requests an Auth-Endpoints senden
         
-        self.results["info"].append("Authentication testing requires running instance")
+        self._add("info", "Authentication testing requires running instance")
     
-    def generate_report(self):
-        """Generiere Sicherheitsbericht"""
-        print("\n" + "="*60)
-        print("🛡️  SMOLDESK SECURITY SCAN RESULTS")
-        print("="*60)
+    def _format_entries(self, results):
+        """Formatiert die Ergebnisse einer Phase, Zeilen je Kategorie"""
+        with self._results_lock:
+            results = {cat: list(entries) for cat, entries in results.items()}
+        formatted = {}
+        for cat, entries in results.items():
+            lines = formatted[cat] = []
+            if cat == "vulnerabilities":
+                for vuln in entries:
+                    lines.append(f"  ❌ {vuln['type']}: {vuln['description']}")
+                    if 'file' in vuln:
+                        lines.append(f"     File: {vuln['file']} (Permissions: {vuln.get('permissions', 'N/A')})")
+                    if 'payload' in vuln:
+                        lines.append(f"     Payload: {vuln['payload']}")
+            else:
+                icon = _REPORT_ICONS[cat]
+                lines.extend(f"  {icon} {entry}" for entry in entries)
+        return formatted, {cat: len(entries) for cat, entries in results.items()}
+    
+    async def generate_report(self, phases=None):
+        """Generiere Sicherheitsbericht
+        
+        phases ist eine Folge von (Event, Ergebnis-Dict) in fester Reihenfolge.
+        Die Einträge einer Phase werden formatiert, sobald ihr Event gesetzt
+        ist; zusammengesetzt und ausgegeben wird erst, wenn alle fertig sind.
+        Gibt den Bericht zusätzlich als Text zurück.
+        """
+        if phases is None:
+            phases = [(None, self.results)]
+        parts = [None] * len(phases)
+        
+        async def format_phase(i, done, results):
+            if done is not None:
+                await done.wait()
+            parts[i] = self._format_entries(results)
+        
+        await asyncio.gather(*(format_phase(i, *phase) for i, phase in enumerate(phases)))
+        formatted = {cat: [line for lines, _ in parts for line in lines[cat]] for cat in self.results}
+        counts = {cat: sum(count[cat] for _, count in parts) for cat in self.results}
+        
+        # Bericht als Zeilenliste aufbauen und mit einem einzigen write ausgeben
+        lines = ["", "="*60, "🛡️  SMOLDESK SECURITY SCAN RESULTS", "="*60]
         
         # Vulnerabilities
-        if self.results["vulnerabilities"]:
-            print("\n🚨 VULNERABILITIES FOUND:")
-            for vuln in self.results["vulnerabilities"]:
-                print(f"  ❌ {vuln['type']}: {vuln['description']}")
-                if 'file' in vuln:
-                    print(f"     File: {vuln['file']} (Permissions: {vuln.get('permissions', 'N/A')})")
-                if 'payload' in vuln:
-                    print(f"     Payload: {vuln['payload']}")
+        if formatted["vulnerabilities"]:
+            lines += ["", "🚨 VULNERABILITIES FOUND:", *formatted["vulnerabilities"]]
         else:
-            print("\n✅ No critical vulnerabilities found")
+            lines += ["", "✅ No critical vulnerabilities found"]
         
         # Warnings
-        if self.results["warnings"]:
-            print("\n⚠️  WARNINGS:")
-            for warning in self.results["warnings"]:
-                print(f"  🔶 {warning}")
+        if formatted["warnings"]:
+            lines += ["", "⚠️  WARNINGS:", *formatted["warnings"]]
         
         # Informational
-        if self.results["info"]:
-            print("\nℹ️  INFORMATIONAL:")
-            for info in self.results["info"]:
-                print(f"  💡 {info}")
+        if formatted["info"]:
+            lines += ["", "ℹ️  INFORMATIONAL:", *formatted["info"]]
         
         # Passed checks
-        if self.results["passed"]:
-            print("\n✅ PASSED CHECKS:")
-            for passed in self.results["passed"]:
-                print(f"  ✅ {passed}")
+        if formatted["passed"]:
+            lines += ["", "✅ PASSED CHECKS:", *formatted["passed"]]
         
         # Risk Score
         risk_score = (
-            len(self.results["vulnerabilities"]) * 10 +
-            len(self.results["warnings"]) * 3
+            counts["vulnerabilities"] * 10 +
+            counts["warnings"] * 3
         )
         
-        print(f"\n📊 RISK SCORE: {risk_score}")
+        lines += ["", f"📊 RISK SCORE: {risk_score}"]
         if risk_score == 0:
-            print("   🟢 LOW RISK")
+            lines.append("   🟢 LOW RISK")
         elif risk_score < 20:
-            print("   🟡 MEDIUM RISK")
+            lines.append("   🟡 MEDIUM RISK")
         else:
-            print("   🔴 HIGH RISK")
+            lines.append("   🔴 HIGH RISK")
         
         # Recommendations
-        print("\n💡 RECOMMENDATIONS:")
-        if self.results["vulnerabilities"]:
-            print("  1. Address all critical vulnerabilities immediately")
-        if self.results["warnings"]:
-            print("  2. Review and mitigate warnings where possible")
-        print("  3. Run this scan regularly as part of CI/CD")
-        print("  4. Consider professional penetration testing")
-        print("  5. Keep all dependencies updated")
-        
-        print("\n" + "="*60)
+        lines += ["", "💡 RECOMMENDATIONS:"]
+        if counts["vulnerabilities"]:
+            lines.append("  1. Address all critical vulnerabilities immediately")
+        if counts["warnings"]:
+            lines.append("  2. Review and mitigate warnings where possible")
+        lines += [
+            "  3. Run this scan regularly as part of CI/CD",
+            "  4. Consider professional penetration testing",
+            "  5. Keep all dependencies updated",
+            "",
+            "="*60,
+        ]
+        
+        report = "\n".join(lines) + "\n"
+        sys.stdout.write(report)
+        sys.stdout.flush()
+        return report
+    
+    def _cache_key(self):
+        """SHA-256 über Ziel, Scanner-Version und Zustand aller gescannten Dateien"""
+        h = hashlib.sha256()
+        h.update(f"{self.target_host}:{self.target_port}\n".encode())
+        entries = [(__file__, os.stat(__file__), False), *_walk_critical()]
+        for path, st, nested in sorted(entries, key=lambda item: item[0]):
+            h.update(f"{path}:{st.st_mode}:{st.st_mtime_ns}:{st.st_size}\n".encode())
+            if not nested and stat.S_ISREG(st.st_mode):
+                try:
+                    h.update(_sha256(path).encode())
+                except OSError:
+                    pass
+        return h.hexdigest()
     
     async def run_scan(self):
         """Führe kompletten Sicherheitsscan durch"""
         print("🛡️  Starting SmolDesk Security Scan...")
         
-        await self.scan_signaling_server()
-        self.scan_system_dependencies()
-        self.scan_file_permissions()
-        self.scan_network_security()
-        self.scan_authentication_security()
+        cache_path = None
+        if self.cache_hours > 0:
+            cache_path = CACHE_DIR / f"results-{self._cache_key()}.json"
+            try:
+                fresh = time.time() - cache_path.stat().st_mtime < self.cache_hours * 3600
+            except OSError:
+                fresh = False
+            if fresh:
+                cached = _load_json_cache(cache_path)
+                if set(cached) == set(self.results):
+                    print(f"♻️  Using cached results from {cache_path}")
+                    self.results = cached
+                    return await self.generate_report()
+        
+        # Die Phasen sind unabhängig voneinander; die synchronen laufen im
+        # Default-Executor, damit ihre Wartezeiten sich überlappen. Jede Phase
+        # sammelt in ein eigenes Dict, zusammengeführt wird in fester
+        # Reihenfolge, damit Bericht und --output von Lauf zu Lauf gleich
+        # bleiben. Der Bericht formatiert jede Phase, sobald sie fertig ist.
+        phases = {
+            "Signaling server": self.scan_signaling_server,
+            "Dependency": self.scan_system_dependencies,
+            "File permission": lambda: asyncio.to_thread(self.scan_file_permissions),
+            "Network": self.scan_network_security,
+            "Authentication": lambda: asyncio.to_thread(self.scan_authentication_security),
+        }
+        if self.max_seconds:
+            self._deadline = time.monotonic() + self.max_seconds
+        phase_results = [_empty_results() for _ in phases]
+        events = [asyncio.Event() for _ in phases]
+        # Meldungen von run_scan selbst (Abbruch) kommen ans Ende
+        tail_done = asyncio.Event()
+        report = asyncio.create_task(self.generate_report(
+            [*zip(events, phase_results), (tail_done, self.results)]
+        ))
+        
+        async def run_phase(name, start, results, done):
+            # Eigener Task, der Kontextwert gilt nur für diese Phase
+            _PHASE_RESULTS.set(results)
+            try:
+                await asyncio.wait_for(start(), timeout=PHASE_TIMEOUT)
+            except asyncio.TimeoutError:
+                self._add("warnings", f"{name} scan timed out after {PHASE_TIMEOUT}s")
+                self._close_phases(results)
+            finally:
+                done.set()
+        
+        async def run_phases():
+            async with self:
+                await asyncio.gather(*map(run_phase, phases, phases.values(), phase_results, events))
+        
+        try:
+            await asyncio.wait_for(run_phases(), timeout=self.max_seconds or None)
+        except asyncio.TimeoutError:
+            self._add("warnings", f"Scan aborted after {self.max_seconds:g}s")
+            self._close_phases(*phase_results)
+            for done in events:
+                done.set()
+            completed = False
+        else:
+            completed = True
+        tail_done.set()
+        text = await report
         
-        self.generate_report()
+        merged = _empty_results()
+        for results in (*phase_results, self.results):
+            for cat, entries in results.items():
+                merged[cat].extend(entries)
+        self.results = merged
+        
+        # Unvollständige Ergebnisse nicht zwischenspeichern
+        if completed and cache_path is not None:
+            _save_json_cache(cache_path, self.results)
+        
+        return text
 
 def main():
     parser = argparse.ArgumentParser(description="SmolDesk Security Scanner")
     parser.add_argument("--host", default="localhost", help="Target host")
     parser.add_argument("--port", type=int, default=3000, help="Target port")
     parser.add_argument("--output", help="Output file for results")
+    parser.add_argument("--cache-hours", type=float, default=0,
+                        help="Reuse cached results for unchanged inputs (0 = disabled)")
+    parser.add_argument("--max-seconds", type=float, default=0,
+                        help="Abort the scan after this many seconds (0 = no limit)")
     
     args = parser.parse_args()
     
-    scanner = SmolDeskSecurityScanner(args.host, args.port)
+    scanner = SmolDeskSecurityScanner(args.host, args.port, args.cache_hours, args.max_seconds)
     
     try:
-        asyncio.run(scanner.run_scan())
+        # uvloop beschleunigt die vielen kleinen WebSocket-Roundtrips, ist aber
+        # optional; uvloop.run (ab 0.18) statt des veralteten uvloop.install()
+        try:
+            from uvloop import run
+        except ImportError:
+            run = asyncio.run
+        
+        run(scanner.run_scan())
         
         if args.output:
-            with open(args.output, 'w') as f:
-                json.dump(scanner.results, f, indent=2)
+            # orjson ist optional, sonst Standard-json
+            try:
+                import orjson
+            except ImportError:
+                orjson = None
+            if orjson is not None:
+                Path(args.output).write_bytes(orjson.dumps(scanner.results, option=orjson.OPT_INDENT_2))
+            else:
+                with open(args.output, 'w') as f:
+                    json.dump(scanner.results, f, indent=2)
             print(f"\nResults saved to {args.output}")
     
     except KeyboardInterrupt: